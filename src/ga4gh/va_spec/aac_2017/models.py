@@ -8,8 +8,9 @@ from enum import Enum
 
 from pydantic import (
     Field,
-    field_validator,
+    model_validator,
 )
+from typing_extensions import Self
 
 from ga4gh.core.models import MappableConcept, iriReference
 from ga4gh.va_spec.base.core import (
@@ -50,7 +51,7 @@ class Strength(str, Enum):
     LEVEL_D = "Level D"
 
 
-AMP_ASCO_CAP_LEVELS = [v.value for v in Strength.__members__.values()]
+AMP_ASCO_CAP_LEVELS = tuple(v.value for v in Strength)
 
 
 class Classification(str, Enum):
@@ -62,41 +63,37 @@ class Classification(str, Enum):
     TIER_IV = "Tier IV"
 
 
-AMP_ASCO_CAP_TIERS = [v.value for v in Classification.__members__.values()]
+AMP_ASCO_CAP_TIERS = tuple(v.value for v in Classification)
 
 
 class AmpAscoCapValidatorMixin:
-    """Mixin class for reusable AMP/ASCO/CAP field validators
+    """Mixin class for reusable AMP/ASCO/CAP validators
 
     Should be used with classes that inherit from Statement
     """
 
-    @field_validator("strength")
-    @classmethod
-    def validate_strength(cls, v: MappableConcept | None) -> MappableConcept | None:
-        """Validate strength
+    __slots__ = ()
 
-        :param v: Strength
-        :raises ValueError: If invalid strength values are provided
-        :return: Validated strength value
+    @model_validator(mode="after")
+    def validate_model(self) -> Self:
+        """Validate ``strength`` and ``classification`` properties
+
+        Both checks run in a single model validator rather than one field validator
+        per property.
+
+        :raises ValueError: If invalid strength or classification values are provided
+        :return: Validated model
         """
-        return validate_mappable_concept(
-            v,
+        validate_mappable_concept(
+            self.strength,
             SYSTEM,
             valid_codes=AMP_ASCO_CAP_LEVELS,
             mc_is_required=False,
         )
-
-    @field_validator("classification")
-    @classmethod
-    def validate_classification(cls, v: MappableConcept) -> MappableConcept:
-        """Validate classification
-
-        :param v: Classification
-        :raises ValueError: If invalid classification values are provided
-        :return: Validated classification value
-        """
-        return validate_mappable_concept(v, SYSTEM, valid_codes=AMP_ASCO_CAP_TIERS)
+        validate_mappable_concept(
+            self.classification, SYSTEM, valid_codes=AMP_ASCO_CAP_TIERS
+        )
+        return self
 
 
 class VariantDiagnosticStudyStatement(Statement, AmpAscoCapValidatorMixin):
@@ -3,9 +3,10 @@ of Medical Genetics and Genomics (ACMG) 2015 guidelines for interpretation of se
 variant pathogenicity.
 """
 
+import re
 from enum import Enum
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, model_validator
 from typing_extensions import Self
 
 from ga4gh.core.models import MappableConcept, iriReference
@@ -43,6 +44,10 @@ METHOD = Method(  # recommended representation of ACMG 2015 method
     methodType="guideline",
 )
 
+_ACMG_CODE_PATTERN = re.compile(
+    r"^((?:PVS1)(?:_(?:not_met|(?:strong|moderate|supporting)))?|(?:PS[1-4]|BS[1-4])(?:_(?:not_met|(?:very_strong|moderate|supporting)))?|BA1(?:_not_met)?|(?:PM[1-6])(?:_(?:not_met|(?:very_strong|strong|supporting)))?|(PP[1-5]|BP[1-7])(?:_(?:not_met|very_strong|strong|moderate))?)$"
+)
+
 
 class AcmgClassification(str, Enum):
     """Define constraints for ACMG classifications"""
@@ -54,7 +59,16 @@ class AcmgClassification(str, Enum):
     UNCERTAIN_SIGNIFICANCE = "uncertain significance"
 
 
-ACMG_CLASSIFICATIONS = [v.value for v in AcmgClassification.__members__.values()]
+ACMG_CLASSIFICATIONS = tuple(v.value for v in AcmgClassification)
+
+_CLASSIFICATION_SYSTEMS = [SYSTEM.value, System.CLIN_GEN.value]
+_CLASSIFICATION_SYSTEMS_ERR = (
+    f"`primaryCoding.system` must be one of: {_CLASSIFICATION_SYSTEMS}."
+)
+_CLASSIFICATION_CODES = {  # system -> valid codes
+    SYSTEM: ACMG_CLASSIFICATIONS,
+    System.CLIN_GEN: CLIN_GEN_CLASSIFICATIONS,
+}
 
 
 class VariantPathogenicityEvidenceLine(EvidenceLine):
@@ -110,38 +124,26 @@ class VariantPathogenicityEvidenceLine(EvidenceLine):
         BP6 = "BP6"
         BP7 = "BP7"
 
-    @field_validator("strengthOfEvidenceProvided")
-    @classmethod
-    def validate_strength_of_evidence_provided(
-        cls, v: MappableConcept | None
-    ) -> MappableConcept | None:
-        """Validate strengthOfEvidenceProvided
-
-        :param v: strengthOfEvidenceProvided
-        :raises ValueError: If invalid strengthOfEvidenceProvided values are provided
-        :return: Validated strengthOfEvidenceProvided value
-        """
-        return validate_mappable_concept(
-            v,
-            SYSTEM,
-            valid_codes=STRENGTH_OF_EVIDENCE_PROVIDED_VALUES,
-            mc_is_required=False,
-        )
-
     @model_validator(mode="after")
     def validate_model(self) -> Self:
-        """Validate ``evidenceOutcome`` and ``directionOfEvidenceProvided`` properties
+        """Validate ``strengthOfEvidenceProvided``, ``evidenceOutcome`` and
+        ``directionOfEvidenceProvided`` properties
 
-        :raises ValueError: If ``evidenceOutcome`` exists and is invalid
-        :return: Validated input values. If ``evidenceOutcome`` exists.
+        :raises ValueError: If invalid strengthOfEvidenceProvided values are provided.
+            Or if ``evidenceOutcome`` exists and is invalid.
             Or if ``strengthOfEvidenceProvided`` is not provided when
             ``directionOfEvidenceProvided`` is supports or disputes or if
             ``strengthOfEvidenceProvided`` is provided when
             ``directionOfEvidenceProvided`` is neutral
         """
+        validate_mappable_concept(
+            self.strengthOfEvidenceProvided,
+            SYSTEM,
+            valid_codes=STRENGTH_OF_EVIDENCE_PROVIDED_VALUES,
+            mc_is_required=False,
+        )
         self._validate_direction_of_evidence_provided()
-        acmg_code_pattern = r"^((?:PVS1)(?:_(?:not_met|(?:strong|moderate|supporting)))?|(?:PS[1-4]|BS[1-4])(?:_(?:not_met|(?:very_strong|moderate|supporting)))?|BA1(?:_not_met)?|(?:PM[1-6])(?:_(?:not_met|(?:very_strong|strong|supporting)))?|(PP[1-5]|BP[1-7])(?:_(?:not_met|very_strong|strong|moderate))?)$"
-        return self._validate_evidence_outcome(SYSTEM, acmg_code_pattern)
+        return self._validate_evidence_outcome(SYSTEM, _ACMG_CODE_PATTERN)
 
 
 class VariantPathogenicityStatement(Statement):
@@ -164,46 +166,30 @@ class VariantPathogenicityStatement(Statement):
         description="The method that specifies how the pathogenicity classification is ultimately assigned to the variant, based on assessment of evidence.",
     )
 
-    @field_validator("strength")
-    @classmethod
-    def validate_strength(cls, v: MappableConcept | None) -> MappableConcept | None:
-        """Validate strength
+    @model_validator(mode="after")
+    def validate_model(self) -> Self:
+        """Validate ``strength`` and ``classification`` properties
 
-        :param v: strength
-        :raises ValueError: If invalid strength values are provided
-        :return: Validated strength value
+        :raises ValueError: If invalid strength or classification values are provided
+        :return: Validated model
         """
-        return validate_mappable_concept(
-            v, SYSTEM, valid_codes=STRENGTHS, mc_is_required=False
+        validate_mappable_concept(
+            self.strength, SYSTEM, valid_codes=STRENGTHS, mc_is_required=False
         )
 
-    @field_validator("classification")
-    @classmethod
-    def validate_classification(cls, v: MappableConcept) -> MappableConcept:
-        """Validate classification
-
-        :param v: classification
-        :raises ValueError: If invalid classification values are provided
-        :return: Validated classification value
-        """
-        if not v.primaryCoding:
+        primary_coding = self.classification.primaryCoding
+        if not primary_coding:
             err_msg = "`primaryCoding` is required."
             raise ValueError(err_msg)
 
-        supported_systems = [SYSTEM.value, System.CLIN_GEN.value]
-        if v.primaryCoding.system not in supported_systems:
-            err_msg = f"`primaryCoding.system` must be one of: {supported_systems}."
-            raise ValueError(err_msg)
+        valid_codes = _CLASSIFICATION_CODES.get(primary_coding.system)
+        if valid_codes is None:
+            raise ValueError(_CLASSIFICATION_SYSTEMS_ERR)
 
-        if v.primaryCoding.system == SYSTEM:
-            if v.primaryCoding.code.root not in ACMG_CLASSIFICATIONS:
-                err_msg = f"`primaryCoding.code` must be one of {ACMG_CLASSIFICATIONS}."
-                raise ValueError(err_msg)
-        else:
-            if v.primaryCoding.code.root not in CLIN_GEN_CLASSIFICATIONS:
-                err_msg = (
-                    f"`primaryCoding.code` must be one of {CLIN_GEN_CLASSIFICATIONS}."
-                )
-                raise ValueError(err_msg)
-
-        return v
+        validate_mappable_concept(
+            self.classification,
+            System(primary_coding.system),
+            valid_codes=valid_codes,
+            mc_is_required=True,
+        )
+        return self
@@ -49,7 +49,6 @@ __all__ = [
     "CLIN_GEN_CLASSIFICATIONS",
     "CcvClassification",
     "ClinGenClassification",
-    "ClinGenClassification",
     "ClinicalVariantProposition",
     "CohortAlleleFrequencyStudyResult",
     "Condition",
@@ -63,7 +62,6 @@ __all__ = [
     "EvidenceLine",
     "ExperimentalVariantFunctionalImpactProposition",
     "ExperimentalVariantFunctionalImpactStudyResult",
-    "ExperimentalVariantFunctionalImpactStudyResult",
     "InformationEntity",
     "MembershipOperator",
     "Method",
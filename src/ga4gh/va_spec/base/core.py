@@ -4,16 +4,19 @@ from __future__ import annotations
 
 import importlib
 import inspect
+import re
 from abc import ABC
 from datetime import date, datetime
 from enum import Enum
-from typing import Annotated, Literal, TypeVar
+from functools import cache
+from typing import Annotated, Literal, TypeVar, get_args
 
 from pydantic import (
     ConfigDict,
     Field,
     RootModel,
     StringConstraints,
+    TypeAdapter,
     ValidationError,
     field_validator,
 )
@@ -40,6 +43,16 @@ StatementType = TypeVar("StatementType")
 EvidenceLineType = TypeVar("EvidenceLineType")
 
 
+@cache
+def _list_adapter(model: type) -> TypeAdapter:
+    """Get a cached type adapter for validating a list of ``model`` instances
+
+    :param model: Pydantic model for list items
+    :return: Type adapter for ``list[model]``
+    """
+    return TypeAdapter(list[model])
+
+
 class CoreType(str, Enum):
     """Define VA Spec Base Core Types"""
 
@@ -59,9 +72,11 @@ class Contribution(Entity, BaseModelForbidExtra):
     DataSet, Publication, etc.)
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["Contribution"] = Field(
         default=CoreType.CONTRIBUTION.value,
-        description=f"MUST be '{CoreType.CONTRIBUTION.value}'.",
+        description="MUST be 'Contribution'.",
     )
     contributor: Agent | None = Field(
         default=None, description="The agent that made the contribution."
@@ -75,14 +90,20 @@ class Contribution(Entity, BaseModelForbidExtra):
     )
 
 
+_URL_PATTERN = r"^(https?|s?ftp)://"
+_DOI_PATTERN = r"^10\.(\d+)(\.\d+)*\/[\w\-\.]+"
+
+
 class Document(Entity, BaseModelForbidExtra):
     """A collection of information, usually in a text-based or graphic human-readable
     form, intended to be read and understood together as a whole.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["Document"] = Field(
         default=CoreType.DOCUMENT.value,
-        description=f"Must be '{CoreType.DOCUMENT.value}'",
+        description="Must be 'Document'",
     )
     documentType: str | None = Field(
         default=None,
@@ -92,16 +113,11 @@ class Document(Entity, BaseModelForbidExtra):
         default=None,
         description="The official title given to the document by its authors.",
     )
-    urls: (
-        list[Annotated[str, StringConstraints(pattern=r"^(https?|s?ftp)://")]] | None
-    ) = Field(
+    urls: list[Annotated[str, StringConstraints(pattern=_URL_PATTERN)]] | None = Field(
         default=None,
         description="One or more URLs from which the content of the Document can be retrieved.",
     )
-    doi: (
-        Annotated[str, StringConstraints(pattern=r"^10\.(\d+)(\.\d+)*\/[\w\-\.]+")]
-        | None
-    ) = Field(
+    doi: Annotated[str, StringConstraints(pattern=_DOI_PATTERN)] | None = Field(
         default=None,
         description="A [Digital Object Identifier](https://www.doi.org/the-identifier/what-is-a-doi/) for the document.",
     )
@@ -114,8 +130,10 @@ class Document(Entity, BaseModelForbidExtra):
 class Method(Entity, BaseModelForbidExtra):
     """A set of instructions that specify how to achieve some objective."""
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["Method"] = Field(
-        default=CoreType.METHOD.value, description=f"MUST be '{CoreType.METHOD.value}'."
+        default=CoreType.METHOD.value, description="MUST be 'Method'."
     )
     methodType: str | None = Field(
         default=None,
@@ -132,6 +150,8 @@ class InformationEntity(Entity):
     images.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     specifiedBy: Method | iriReference | None = Field(
         default=None,
         description="A specification that describes all or part of the process that led to creation of the Information Entity",
@@ -151,9 +171,11 @@ class DataSet(Entity, BaseModelForbidExtra):
     common format or structure, to enable their computational manipulation as a unit.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["DataSet"] = Field(
         default=CoreType.DATA_SET.value,
-        description=f"MUST be '{CoreType.DATA_SET.value}'.",
+        description="MUST be 'DataSet'.",
     )
     datasetType: str | None = Field(
         default=None,
@@ -183,9 +205,11 @@ class StudyGroup(Entity, BaseModelForbidExtra):
     referred to as a 'cohort' or 'population' in specific research settings.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["StudyGroup"] = Field(
         default=CoreType.STUDY_GROUP.value,
-        description=f"Must be '{CoreType.STUDY_GROUP.value}'",
+        description="Must be 'StudyGroup'",
     )
     memberCount: int | None = Field(
         default=None,
@@ -238,8 +262,11 @@ class CohortAlleleFrequencyStudyResult(_StudyResult, BaseModelForbidExtra):
         ...,
         description="The number of occurrences of all alleles at the locus in the cohort.",
     )
-    focusAlleleFrequency: int | float = Field(
-        ..., description="The frequency of the focusAllele in the cohort."
+    focusAlleleFrequency: float = Field(
+        ...,
+        ge=0,
+        le=1,
+        description="The frequency of the focusAllele in the cohort.",
     )
     cohort: StudyGroup = Field(
         ..., description="The cohort from which the frequency was derived."
@@ -249,6 +276,31 @@ class CohortAlleleFrequencyStudyResult(_StudyResult, BaseModelForbidExtra):
         description="A list of CohortAlleleFrequency objects describing subcohorts of the cohort currently being described. Subcohorts can be further subdivided into more subcohorts. This enables, for example, the description of different ancestry groups and sexes among those ancestry groups.",
     )
 
+    @classmethod
+    def validate_many(cls, data: list) -> list[Self]:
+        """Validate a list of Cohort Allele Frequency Study Results in a single pass
+
+        The whole list is validated by pydantic-core, rather than calling
+        ``model_validate`` once per item.
+
+        :param data: List of Cohort Allele Frequency Study Results (as dicts or
+            model instances)
+        :raises ValidationError: If any item is invalid
+        :return: List of validated Cohort Allele Frequency Study Results
+        """
+        return _list_adapter(cls).validate_python(data)
+
+    @classmethod
+    def validate_many_json(cls, data: str | bytes) -> list[Self]:
+        """Validate a JSON array of Cohort Allele Frequency Study Results in a single
+        pass, without first loading it with ``json.loads``
+
+        :param data: JSON array of Cohort Allele Frequency Study Results
+        :raises ValidationError: If the JSON is malformed or any item is invalid
+        :return: List of validated Cohort Allele Frequency Study Results
+        """
+        return _list_adapter(cls).validate_json(data)
+
 
 class TumorVariantFrequencyStudyResult(_StudyResult, BaseModelForbidExtra):
     """A Study Result that reports measures related to the frequency of an variant
@@ -322,6 +374,8 @@ class StudyResult(RootModel):
     describing how these data items were generated.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     root: (
         CohortAlleleFrequencyStudyResult
         | ExperimentalVariantFunctionalImpactStudyResult
@@ -341,6 +395,8 @@ class Proposition(Entity):
     true by some agent.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     subject: dict = Field(
         ..., description="The Entity or concept about which the Proposition is made."
     )
@@ -357,6 +413,8 @@ class Proposition(Entity):
 class SubjectVariantProposition(RootModel):
     """A `Proposition` that has a variant as the subject."""
 
+    model_config = ConfigDict(defer_build=True)
+
     root: (
         ExperimentalVariantFunctionalImpactProposition
         | VariantPathogenicityProposition
@@ -368,6 +426,8 @@ class SubjectVariantProposition(RootModel):
 
 
 class _SubjectVariantPropositionBase(Entity, ABC):
+    model_config = ConfigDict(defer_build=True)
+
     subjectVariant: MolecularVariation | CategoricalVariant | iriReference = Field(
         ..., description="A variant that is the subject of the Proposition."
     )
@@ -522,8 +582,10 @@ class Agent(Entity, BaseModelForbidExtra):
     or for another agent's activity.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["Agent"] = Field(
-        default=CoreType.AGENT.value, description=f"MUST be '{CoreType.AGENT.value}'."
+        default=CoreType.AGENT.value, description="MUST be 'Agent'."
     )
     name: str | None = Field(default=None, description="The given name of the Agent.")
     agentType: str | None = Field(
@@ -542,6 +604,75 @@ class Direction(str, Enum):
     DISPUTES = "disputes"
 
 
+_STRENGTH_REQUIRED_DIRECTIONS = frozenset(
+    (Direction.SUPPORTS.value, Direction.DISPUTES.value)
+)
+_STRENGTH_REQUIRED_ERR = f"`strengthOfEvidenceProvided` is required when `directionOfEvidenceProvided` is '{Direction.SUPPORTS.value}' or '{Direction.DISPUTES.value}'."
+_NEUTRAL_DIRECTION = Direction.NEUTRAL.value
+_STRENGTH_NOT_ALLOWED_ERR = f"`strengthOfEvidenceProvided` is not allowed when `directionOfEvidenceProvided` is '{_NEUTRAL_DIRECTION}'."
+
+
+@cache
+def _has_evidence_items_models() -> tuple[type, ...]:
+    """Get the models that ``EvidenceLine.hasEvidenceItems`` values are validated
+    against, in the order they are tried
+
+    The profile modules import this module, so they are imported on first use rather
+    than at module level. The result is cached so that the modules are only scanned
+    once.
+
+    :return: Candidate models for evidence items
+    """
+    # Avoid circular imports
+    has_evidence_items_models = []
+    for module in [
+        "ga4gh.va_spec.aac_2017.models",
+        "ga4gh.va_spec.acmg_2015.models",
+        "ga4gh.va_spec.ccv_2022.models",
+    ]:
+        imported_module = importlib.import_module(module)
+        has_evidence_items_models.extend(
+            [
+                obj_
+                for _, obj_ in vars(imported_module).items()
+                if inspect.isclass(obj_)
+                and issubclass(obj_, Statement)
+                and obj_.__name__.endswith(("Statement", "EvidenceLine"))
+                and obj_ not in (Statement, EvidenceLine)
+            ]
+        )
+
+    has_evidence_items_models.extend(
+        [Statement, StudyResult, EvidenceLine, iriReference]
+    )
+    return tuple(has_evidence_items_models)
+
+
+@cache
+def _has_evidence_items_models_by_type() -> dict[str, tuple[type, ...]]:
+    """Group the ``hasEvidenceItems`` candidate models by their ``type`` value
+
+    Root models are grouped under the ``type`` values of their members. Models
+    without a ``type`` field (i.e. ``iriReference``) are omitted. Within each group,
+    models are kept in the order they are tried.
+
+    :return: Mapping from ``type`` value to candidate models
+    """
+    models_by_type = {}
+    for model in _has_evidence_items_models():
+        if issubclass(model, RootModel):
+            members = get_args(model.model_fields["root"].annotation)
+        else:
+            members = (model,)
+
+        for member in members:
+            if "type" in getattr(member, "model_fields", {}):
+                models_by_type.setdefault(
+                    member.model_fields["type"].default, []
+                ).append(model)
+    return {type_: tuple(models) for type_, models in models_by_type.items()}
+
+
 class EvidenceLine(InformationEntity, BaseModelForbidExtra):
     """An independent, evidence-based argument that may support or refute the validity
     of a specific Proposition. The strength and direction of this argument is based on
@@ -553,7 +684,7 @@ class EvidenceLine(InformationEntity, BaseModelForbidExtra):
 
     type: Literal["EvidenceLine"] = Field(
         default=CoreType.EVIDENCE_LINE.value,
-        description=f"MUST be '{CoreType.EVIDENCE_LINE.value}'.",
+        description="MUST be 'EvidenceLine'.",
     )
     targetProposition: Proposition | SubjectVariantProposition | None = Field(
         default=None,
@@ -602,33 +733,20 @@ class EvidenceLine(InformationEntity, BaseModelForbidExtra):
 
         evidence_items = []
 
-        # Avoid circular imports
-        has_evidence_items_models = []
-        for module in [
-            "ga4gh.va_spec.aac_2017.models",
-            "ga4gh.va_spec.acmg_2015.models",
-            "ga4gh.va_spec.ccv_2022.models",
-        ]:
-            imported_module = importlib.import_module(module)
-            has_evidence_items_models.extend(
-                [
-                    obj_
-                    for _, obj_ in vars(imported_module).items()
-                    if inspect.isclass(obj_)
-                    and issubclass(obj_, Statement)
-                    and obj_.__name__.endswith(("Statement", "EvidenceLine"))
-                    and obj_ not in (Statement, EvidenceLine)
-                ]
-            )
-
-        has_evidence_items_models.extend(
-            [Statement, StudyResult, EvidenceLine, iriReference]
-        )
+        has_evidence_items_models = _has_evidence_items_models()
+        has_evidence_items_models_by_type = _has_evidence_items_models_by_type()
 
         for evidence_item in v:
             if isinstance(evidence_item, dict):
+                # Only try models that accept the item's type, if it has one
+                item_type = evidence_item.get("type")
+                candidate_models = has_evidence_items_models
+                if isinstance(item_type, str):
+                    candidate_models = has_evidence_items_models_by_type.get(
+                        item_type, candidate_models
+                    )
                 found_model = False
-                for evidence_item_model in has_evidence_items_models:
+                for evidence_item_model in candidate_models:
                     try:
                         evidence_item = evidence_item_model(**evidence_item)
                     except ValidationError:
@@ -642,14 +760,16 @@ class EvidenceLine(InformationEntity, BaseModelForbidExtra):
                     raise ValueError(err_msg)
             elif isinstance(evidence_item, str):
                 evidence_items.append(iriReference(root=evidence_item))
-            elif isinstance(evidence_item, tuple(has_evidence_items_models)):
+            elif isinstance(evidence_item, has_evidence_items_models):
                 evidence_items.append(evidence_item)
             else:
                 err_msg = "Unable to find valid model for `hasEvidenceItems`"
                 raise ValueError(err_msg)
         return evidence_items
 
-    def _validate_evidence_outcome(self, system: System, code_pattern: str) -> Self:
+    def _validate_evidence_outcome(
+        self, system: System, code_pattern: str | re.Pattern
+    ) -> Self:
         """Validate ``evidenceOutcome`` property if it exists
 
         :param system: System that should be used for ``primaryCoding.system``
@@ -677,18 +797,16 @@ class EvidenceLine(InformationEntity, BaseModelForbidExtra):
         direction_of_evidence_provided = self.directionOfEvidenceProvided
         strength_of_evidence_provided = self.strengthOfEvidenceProvided
         if (
-            direction_of_evidence_provided in (Direction.SUPPORTS, Direction.DISPUTES)
+            direction_of_evidence_provided in _STRENGTH_REQUIRED_DIRECTIONS
             and strength_of_evidence_provided is None
         ):
-            err_msg = f"`strengthOfEvidenceProvided` is required when `directionOfEvidenceProvided` is '{Direction.SUPPORTS.value}' or '{Direction.DISPUTES.value}'."
-            raise ValueError(err_msg)
+            raise ValueError(_STRENGTH_REQUIRED_ERR)
 
         if (
-            direction_of_evidence_provided == Direction.NEUTRAL
+            direction_of_evidence_provided == _NEUTRAL_DIRECTION
             and strength_of_evidence_provided
         ):
-            err_msg = f"`strengthOfEvidenceProvided` is not allowed when `directionOfEvidenceProvided` is '{Direction.NEUTRAL.value}'."
-            raise ValueError(err_msg)
+            raise ValueError(_STRENGTH_NOT_ALLOWED_ERR)
 
         return self
 
@@ -701,12 +819,13 @@ class EvidenceLine(InformationEntity, BaseModelForbidExtra):
         :raises ValueError: If invalid specifiedBy values are provided
         :return: Validated specifiedBy value
         """
-        if hasattr(cls, "Criterion") and isinstance(v, Method):
+        criterion = getattr(cls, "Criterion", None)
+        if criterion is not None and isinstance(v, Method):
             if not v.reportedIn:
                 err_msg = "`reportedIn` is required."
                 raise ValueError(err_msg)
 
-            cls.Criterion(v.methodType)
+            criterion(v.methodType)
 
         return v
 
@@ -722,7 +841,7 @@ class Statement(InformationEntity, BaseModelForbidExtra):
 
     type: Literal["Statement"] = Field(
         default=CoreType.STATEMENT.value,
-        description=f"MUST be '{CoreType.STATEMENT.value}'.",
+        description="MUST be 'Statement'.",
     )
     proposition: (
         ExperimentalVariantFunctionalImpactProposition
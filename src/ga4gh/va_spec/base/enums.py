@@ -47,9 +47,9 @@ class StrengthOfEvidenceProvided(str, Enum):
     SUPPORTING = "supporting"
 
 
-STRENGTH_OF_EVIDENCE_PROVIDED_VALUES = [
-    v.value for v in StrengthOfEvidenceProvided.__members__.values()
-]
+STRENGTH_OF_EVIDENCE_PROVIDED_VALUES = tuple(
+    v.value for v in StrengthOfEvidenceProvided
+)
 
 
 class Strength(str, Enum):
@@ -59,7 +59,7 @@ class Strength(str, Enum):
     LIKELY = "likely"
 
 
-STRENGTHS = [v.value for v in Strength.__members__.values()]
+STRENGTHS = tuple(v.value for v in Strength)
 
 
 class ClinGenClassification(str, Enum):
@@ -72,7 +72,7 @@ class ClinGenClassification(str, Enum):
     UNCERTAIN_RISK_ALLELE = "uncertain risk allele"
 
 
-CLIN_GEN_CLASSIFICATIONS = [v.value for v in ClinGenClassification.__members__.values()]
+CLIN_GEN_CLASSIFICATIONS = tuple(v.value for v in ClinGenClassification)
 
 
 class CcvClassification(str, Enum):
@@ -85,7 +85,7 @@ class CcvClassification(str, Enum):
     BENIGN = "benign"
 
 
-CCV_CLASSIFICATIONS = [v.value for v in CcvClassification.__members__.values()]
+CCV_CLASSIFICATIONS = tuple(v.value for v in CcvClassification)
 
 
 class System(str, Enum):
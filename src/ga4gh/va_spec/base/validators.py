@@ -1,16 +1,49 @@
 """Shared validator functions"""
 
 import re
+from collections.abc import Sequence
+from functools import cache
 
 from ga4gh.core.models import MappableConcept
 from ga4gh.va_spec.base.enums import System
 
 
+@cache
+def _system_err_msg(valid_system: System) -> str:
+    """Get error message for an invalid ``primaryCoding.system``
+
+    :param valid_system: The system that should be used
+    :return: Error message
+    """
+    return f"`primaryCoding.system` must be '{valid_system.value}'."
+
+
+@cache
+def _codes_err_msg(valid_codes: tuple[str, ...]) -> str:
+    """Get error message for a ``primaryCoding.code`` not in ``valid_codes``
+
+    :param valid_codes: The codes that should be used for ``primaryCoding.code``
+    :return: Error message
+    """
+    return f"`primaryCoding.code` must be one of {list(valid_codes)}."
+
+
+@cache
+def _code_pattern_err_msg(code_pattern: re.Pattern) -> str:
+    """Get error message for a ``primaryCoding.code`` not matching ``code_pattern``
+
+    :param code_pattern: The regex pattern that should be used for
+        ``primaryCoding.code``
+    :return: Error message
+    """
+    return f"`primaryCoding.code` does not match regex pattern {code_pattern.pattern}."
+
+
 def validate_mappable_concept(
     mc: MappableConcept | None,
     valid_system: System,
-    valid_codes: list[str] | None = None,
-    code_pattern: str | None = None,
+    valid_codes: Sequence[str] | None = None,
+    code_pattern: str | re.Pattern | None = None,
     mc_is_required: bool = False,
 ) -> MappableConcept | None:
     """Validate GKS Core Mappable Concept object
@@ -18,8 +51,8 @@ def validate_mappable_concept(
     :param mc: Mappable Concept object
     :param valid_system: The system that should be used
     :param valid_codes: The codes that should be used for ``primaryCoding.code``
-    :param code_pattern: The regex pattern that should be used for
-        ``primaryCoding.code``
+    :param code_pattern: The regex pattern (or precompiled pattern) that should be
+        used for ``primaryCoding.code``
     :param mc_is_required: Whether or not `mc` is required
     :raises ValueError: If `mc` is invalid
     :return: Validated mappable concept
@@ -27,22 +60,21 @@ def validate_mappable_concept(
     if not mc_is_required and not mc:
         return mc
 
-    if not mc.primaryCoding:
+    primary_coding = mc.primaryCoding
+    if not primary_coding:
         err_msg = "`primaryCoding` is required."
         raise ValueError(err_msg)
 
-    if mc.primaryCoding.system != valid_system:
-        err_msg = f"`primaryCoding.system` must be '{valid_system.value}'."
-        raise ValueError(err_msg)
+    if primary_coding.system != valid_system:
+        raise ValueError(_system_err_msg(valid_system))
 
-    if valid_codes is not None and mc.primaryCoding.code.root not in valid_codes:
-        err_msg = f"`primaryCoding.code` must be one of {valid_codes}."
-        raise ValueError(err_msg)
+    code = primary_coding.code.root
+    if valid_codes is not None and code not in valid_codes:
+        raise ValueError(_codes_err_msg(tuple(valid_codes)))
 
-    if code_pattern is not None and not re.match(
-        code_pattern, mc.primaryCoding.code.root
-    ):
-        err_msg = f"`primaryCoding.code` does not match regex pattern {code_pattern}."
-        raise ValueError(err_msg)
+    if code_pattern is not None:
+        code_pattern = re.compile(code_pattern)
+        if not code_pattern.match(code):
+            raise ValueError(_code_pattern_err_msg(code_pattern))
 
     return mc
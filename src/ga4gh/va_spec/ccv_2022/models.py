@@ -3,9 +3,10 @@ Resource (ClinGen), Cancer Genomics Consortium (CGC),and Variant Interpretation
 Cancer Consortium (VICC) 2022 community guidelines for cancer variant interpretation.
 """
 
+import re
 from enum import Enum
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, model_validator
 from typing_extensions import Self
 
 from ga4gh.core.models import MappableConcept, iriReference
@@ -41,6 +42,10 @@ METHOD = Method(  # recommended representation of ClinGen/CGC/VICC 2022 method
     methodType="guideline",
 )
 
+_CCV_CODE_PATTERN = re.compile(
+    r"^((?:OVS1|SBVS1)(?:_(?:not_met|(?:strong|moderate|supporting)))?|(?:OS[1-3]|SBS[1-2])(?:_(?:not_met|(?:very_strong|moderate|supporting)))?|(?:OM[1-4])(?:_(?:not_met|(?:very_strong|strong|supporting)))?|(OP[1-4]|SBP[1-2])(?:_(?:not_met|very_strong|strong|moderate))?)$"
+)
+
 
 class VariantOncogenicityEvidenceLine(EvidenceLine):
     """An Evidence Line that describes how information about the specific evidence of a
@@ -81,37 +86,26 @@ class VariantOncogenicityEvidenceLine(EvidenceLine):
         SBP1 = "SBP1"
         SBP2 = "SBP2"
 
-    @field_validator("strengthOfEvidenceProvided")
-    @classmethod
-    def validate_strength_of_evidence_provided(
-        cls, v: MappableConcept | None
-    ) -> MappableConcept | None:
-        """Validate strengthOfEvidenceProvided
-
-        :param v: strengthOfEvidenceProvided
-        :raises ValueError: If invalid strengthOfEvidenceProvided values are provided
-        :return: Validated strengthOfEvidenceProvided value
-        """
-        return validate_mappable_concept(
-            v,
-            SYSTEM,
-            valid_codes=STRENGTH_OF_EVIDENCE_PROVIDED_VALUES,
-            mc_is_required=False,
-        )
-
     @model_validator(mode="after")
     def validate_model(self) -> Self:
-        """Validate ``evidenceOutcome`` and ``directionOfEvidenceProvided`` properties
+        """Validate ``strengthOfEvidenceProvided``, ``evidenceOutcome`` and
+        ``directionOfEvidenceProvided`` properties
 
-        :raises ValueError: If ``evidenceOutcome`` exists and is invalid.
+        :raises ValueError: If invalid strengthOfEvidenceProvided values are provided.
+            Or if ``evidenceOutcome`` exists and is invalid.
             Or if ``strengthOfEvidenceProvided`` is not provided when
             ``directionOfEvidenceProvided`` is supports or disputes or if
             ``strengthOfEvidenceProvided`` is provided when
             ``directionOfEvidenceProvided`` is neutral
         """
+        validate_mappable_concept(
+            self.strengthOfEvidenceProvided,
+            SYSTEM,
+            valid_codes=STRENGTH_OF_EVIDENCE_PROVIDED_VALUES,
+            mc_is_required=False,
+        )
         self._validate_direction_of_evidence_provided()
-        ccv_code_pattern = r"^((?:OVS1|SBVS1)(?:_(?:not_met|(?:strong|moderate|supporting)))?|(?:OS[1-3]|SBS[1-2])(?:_(?:not_met|(?:very_strong|moderate|supporting)))?|(?:OM[1-4])(?:_(?:not_met|(?:very_strong|strong|supporting)))?|(OP[1-4]|SBP[1-2])(?:_(?:not_met|very_strong|strong|moderate))?)$"
-        return self._validate_evidence_outcome(SYSTEM, ccv_code_pattern)
+        return self._validate_evidence_outcome(SYSTEM, _CCV_CODE_PATTERN)
 
 
 class VariantOncogenicityStudyStatement(Statement):
@@ -136,28 +130,20 @@ class VariantOncogenicityStudyStatement(Statement):
         description="The method that specifies how the oncogenicity classification is ultimately assigned to the variant, based on assessment of evidence.",
     )
 
-    @field_validator("strength")
-    @classmethod
-    def validate_strength(cls, v: MappableConcept | None) -> MappableConcept | None:
-        """Validate strength
+    @model_validator(mode="after")
+    def validate_model(self) -> Self:
+        """Validate ``strength`` and ``classification`` properties
 
-        :param v: strength
-        :raises ValueError: If invalid strength values are provided
-        :return: Validated strength value
+        :raises ValueError: If invalid strength or classification values are provided
+        :return: Validated model
         """
-        return validate_mappable_concept(
-            v, SYSTEM, valid_codes=STRENGTHS, mc_is_required=False
+        validate_mappable_concept(
+            self.strength, SYSTEM, valid_codes=STRENGTHS, mc_is_required=False
         )
-
-    @field_validator("classification")
-    @classmethod
-    def validate_classification(cls, v: MappableConcept) -> MappableConcept:
-        """Validate classification
-
-        :param v: classification
-        :raises ValueError: If invalid classification values are provided
-        :return: Validated classification value
-        """
-        return validate_mappable_concept(
-            v, SYSTEM, valid_codes=CCV_CLASSIFICATIONS, mc_is_required=True
+        validate_mappable_concept(
+            self.classification,
+            SYSTEM,
+            valid_codes=CCV_CLASSIFICATIONS,
+            mc_is_required=True,
         )
+        return self
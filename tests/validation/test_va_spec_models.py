@@ -1,15 +1,13 @@
 """Test VA Spec Pydantic model"""
 
 import json
+import re
 from copy import deepcopy
 
 import pytest
-import yaml
 from pydantic import ValidationError
-from tests.conftest import SUBMODULES_DIR
 
 from ga4gh.core.models import Coding, MappableConcept, code, iriReference
-from ga4gh.va_spec import acmg_2015, base, ccv_2022
 from ga4gh.va_spec.aac_2017.models import VariantTherapeuticResponseStudyStatement
 from ga4gh.va_spec.acmg_2015.models import (
     VariantPathogenicityEvidenceLine,
@@ -20,23 +18,20 @@ from ga4gh.va_spec.base import (
     CohortAlleleFrequencyStudyResult,
     ExperimentalVariantFunctionalImpactStudyResult,
 )
-from ga4gh.va_spec.base.core import EvidenceLine, Method, StudyGroup, StudyResult
+from ga4gh.va_spec.base.core import (
+    EvidenceLine,
+    Method,
+    Statement,
+    StudyGroup,
+    StudyResult,
+    _has_evidence_items_models_by_type,
+)
 from ga4gh.va_spec.base.domain_entities import ConditionSet
 from ga4gh.va_spec.ccv_2022.models import (
     VariantOncogenicityEvidenceLine,
     VariantOncogenicityStudyStatement,
 )
 
-VA_SPEC_TESTS_DIR = SUBMODULES_DIR / "tests"
-VA_SPEC_TEST_FIXTURES = VA_SPEC_TESTS_DIR / "fixtures"
-
-
-@pytest.fixture(scope="module")
-def test_definitions():
-    """Create test fixture for VA Spec test definitions"""
-    with (VA_SPEC_TESTS_DIR / "test_definitions.yaml").open() as f:
-        return yaml.safe_load(f)
-
 
 @pytest.fixture(scope="module")
 def caf():
@@ -151,6 +146,7 @@ def test_caf_study_result(caf):
     assert caf.focusAllele.root == "allele.json#/1"
     assert caf.focusAlleleCount == 0
     assert caf.focusAlleleFrequency == 0
+    assert isinstance(caf.focusAlleleFrequency, float)
     assert caf.locusAlleleCount == 34086
     assert caf.cohort.id == "ALL"
     assert caf.cohort.name == "Overall"
@@ -171,6 +167,30 @@ def test_caf_study_result(caf):
     ):
         caf.focus = "focus"
 
+    invalid_params = caf.model_dump()
+    invalid_params["focusAlleleFrequency"] = 1.5
+    with pytest.raises(
+        ValidationError, match="Input should be less than or equal to 1"
+    ):
+        CohortAlleleFrequencyStudyResult(**invalid_params)
+
+
+def test_caf_study_result_validate_many(caf):
+    """Ensure CohortAlleleFrequencyStudyResult list validation works as expected"""
+    caf_dict = caf.model_dump(exclude_none=True)
+    cafs = CohortAlleleFrequencyStudyResult.validate_many([caf_dict, caf])
+    assert cafs == [caf, caf]
+
+    cafs = CohortAlleleFrequencyStudyResult.validate_many_json(
+        json.dumps([caf_dict, caf_dict])
+    )
+    assert cafs == [caf, caf]
+
+    invalid_params = deepcopy(caf_dict)
+    del invalid_params["cohort"]
+    with pytest.raises(ValidationError, match="1.cohort"):
+        CohortAlleleFrequencyStudyResult.validate_many([caf_dict, invalid_params])
+
 
 def test_experimental_func_impact_study_result():
     """Ensure ExperimentalVariantFunctionalImpactStudyResult model works as expected"""
@@ -318,6 +338,43 @@ def test_evidence_line(caf):
     ):
         EvidenceLine(**invalid_params)
 
+    invalid_params["hasEvidenceItems"] = [{"type": ["Statement"]}]
+    with pytest.raises(
+        ValueError, match="Unable to find valid model for `hasEvidenceItems`"
+    ):
+        EvidenceLine(**invalid_params)
+
+
+def test_evidence_line_has_evidence_items_dispatch(caf):
+    """Ensure hasEvidenceItems dicts are only validated against models for their type"""
+    models_by_type = _has_evidence_items_models_by_type()
+    assert models_by_type["EvidenceLine"] == (EvidenceLine,)
+    assert Statement in models_by_type["Statement"]
+    assert VariantPathogenicityStatement in models_by_type["Statement"]
+    assert models_by_type["CohortAlleleFrequencyStudyResult"] == (StudyResult,)
+
+    el = EvidenceLine(
+        hasEvidenceItems=[
+            {"type": "EvidenceLine", "directionOfEvidenceProvided": "neutral"},
+            caf.model_dump(exclude_none=True),
+        ],
+        directionOfEvidenceProvided="supports",
+    )
+    assert type(el.hasEvidenceItems[0]) is EvidenceLine
+    assert type(el.hasEvidenceItems[1]) is StudyResult
+    assert isinstance(el.hasEvidenceItems[1].root, CohortAlleleFrequencyStudyResult)
+
+    for evidence_item in [
+        {"type": "EvidenceLine"},
+        {"type": "CohortAlleleFrequencyStudyResult", "focusAllele": "allele.json#/1"},
+    ]:
+        with pytest.raises(
+            ValueError, match="Unable to find valid model for `hasEvidenceItems`"
+        ):
+            EvidenceLine(
+                hasEvidenceItems=[evidence_item], directionOfEvidenceProvided="supports"
+            )
+
 
 def test_variant_pathogenicity_stmt():
     """Ensure VariantPathogenicityStatement model works as expected"""
@@ -530,7 +587,12 @@ def test_variant_onco_stmt():
 
     invalid_params = deepcopy(params)
     invalid_params["classification"]["primaryCoding"]["code"] = "pathogenic"
-    with pytest.raises(ValueError, match="`primaryCoding.code` must be one of"):
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "`primaryCoding.code` must be one of ['oncogenic', 'likely oncogenic', 'uncertain significance', 'likely benign', 'benign']."
+        ),
+    ):
         VariantOncogenicityStudyStatement(**invalid_params)
 
     invalid_params = deepcopy(params)
@@ -587,7 +649,12 @@ def test_variant_onco_el():
 
     invalid_params = vo.model_copy(deep=True).model_dump()
     invalid_params["strengthOfEvidenceProvided"]["primaryCoding"]["code"] = "definitive"
-    with pytest.raises(ValueError, match="`primaryCoding.code` must be one of"):
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "`primaryCoding.code` must be one of ['standalone', 'very strong', 'strong', 'moderate', 'supporting']."
+        ),
+    ):
         VariantOncogenicityEvidenceLine(**invalid_params)
 
     invalid_params = vo.model_copy(deep=True).model_dump()
@@ -607,34 +674,3 @@ def test_variant_onco_el():
         match="`strengthOfEvidenceProvided` is not allowed when `directionOfEvidenceProvided` is 'neutral'.",
     ):
         VariantOncogenicityEvidenceLine(**invalid_params)
-
-
-def test_examples(test_definitions):
-    """Test VA Spec examples"""
-    va_spec_schema_mapping = {
-        "va-spec.base": base,
-        "va-spec.acmg-2015": acmg_2015,
-        "va-spec.ccv-2022": ccv_2022,
-    }
-
-    for test in test_definitions["tests"]:
-        with (VA_SPEC_TEST_FIXTURES / test["test_file"]).open() as f:
-            data = yaml.safe_load(f)
-
-        ns = test["namespace"]
-        pydantic_models = va_spec_schema_mapping.get(ns)
-        if not pydantic_models:
-            continue
-
-        schema_model = test["definition"]
-        if schema_model == "Statement":
-            continue
-
-        pydantic_model = getattr(pydantic_models, schema_model, False)
-        assert pydantic_model, schema_model
-
-        try:
-            assert pydantic_model(**data)
-        except ValidationError as e:
-            err_msg = f"ValidationError in {test['test_file']}: {e}"
-            raise AssertionError(err_msg)  # noqa: B904
@@ -62,68 +62,78 @@ for child in VA_SCHEMA_DIR.iterdir():
         _update_va_spec_schema_mapping(f, mapping)
 
 
+SCHEMA_TO_PYDANTIC_MODULE = {
+    VaSpecSchema.AAC_2017: aac_2017,
+    VaSpecSchema.ACMG_2015: acmg_2015,
+    VaSpecSchema.BASE: base,
+    VaSpecSchema.CCV_2022: ccv_2022,
+}
+
+SCHEMA_MODELS = sorted(
+    (va_spec_schema, schema_model)
+    for va_spec_schema, mapping in VA_SPEC_SCHEMA_MAPPING.items()
+    for schema_model in (
+        mapping.base_classes | mapping.concrete_classes | mapping.primitives
+    )
+)
+CONCRETE_SCHEMA_MODELS = sorted(
+    (va_spec_schema, schema_model)
+    for va_spec_schema, mapping in VA_SPEC_SCHEMA_MAPPING.items()
+    for schema_model in mapping.concrete_classes
+)
+
+
 @pytest.mark.parametrize(
-    ("va_spec_schema", "pydantic_models"),
-    [
-        (VaSpecSchema.AAC_2017, aac_2017),
-        (VaSpecSchema.ACMG_2015, acmg_2015),
-        (VaSpecSchema.BASE, base),
-        (VaSpecSchema.CCV_2022, ccv_2022),
-    ],
+    ("va_spec_schema", "schema_model"),
+    SCHEMA_MODELS,
+    ids=[f"{schema.value}-{model}" for schema, model in SCHEMA_MODELS],
 )
-def test_schema_models_in_pydantic(va_spec_schema, pydantic_models):
+def test_schema_models_in_pydantic(va_spec_schema, schema_model):
     """Ensure that each schema model has corresponding Pydantic model"""
-    mapping = VA_SPEC_SCHEMA_MAPPING[va_spec_schema]
-    for schema_model in (
-        mapping.base_classes | mapping.concrete_classes | mapping.primitives
-    ):
-        assert getattr(pydantic_models, schema_model, False), schema_model
+    pydantic_models = SCHEMA_TO_PYDANTIC_MODULE[va_spec_schema]
+    assert hasattr(pydantic_models, schema_model), schema_model
 
 
 @pytest.mark.parametrize(
-    ("va_spec_schema", "pydantic_models"),
-    [
-        (VaSpecSchema.AAC_2017, aac_2017),
-        (VaSpecSchema.ACMG_2015, acmg_2015),
-        (VaSpecSchema.BASE, base),
-        (VaSpecSchema.CCV_2022, ccv_2022),
-    ],
+    ("va_spec_schema", "schema_model"),
+    CONCRETE_SCHEMA_MODELS,
+    ids=[f"{schema.value}-{model}" for schema, model in CONCRETE_SCHEMA_MODELS],
 )
-def test_schema_class_fields(va_spec_schema, pydantic_models):
+def test_schema_class_fields(va_spec_schema, schema_model):
     """Check that each schema model properties exist and are required in corresponding
     Pydantic model, and validate required properties
     """
     mapping = VA_SPEC_SCHEMA_MAPPING[va_spec_schema]
-    for schema_model in mapping.concrete_classes:
-        schema_properties = mapping.va_spec_schema[schema_model]["properties"]
-        pydantic_model = getattr(pydantic_models, schema_model)
-        assert set(pydantic_model.model_fields) == set(schema_properties), schema_model
-
-        required_schema_fields = set(mapping.va_spec_schema[schema_model]["required"])
-
-        for prop, property_def in schema_properties.items():
-            pydantic_model_field_info = pydantic_model.model_fields[prop]
-            pydantic_field_required = pydantic_model_field_info.is_required()
-
-            if prop in required_schema_fields:
-                if prop in {"predicate", "type"}:
-                    assert pydantic_model_field_info
-                else:
-                    assert pydantic_field_required, f"{pydantic_model}.{prop}"
+    schema_properties = mapping.va_spec_schema[schema_model]["properties"]
+    pydantic_model = getattr(SCHEMA_TO_PYDANTIC_MODULE[va_spec_schema], schema_model)
+    pydantic_model_fields = pydantic_model.model_fields
+    assert set(pydantic_model_fields) == set(schema_properties), schema_model
+
+    required_schema_fields = set(mapping.va_spec_schema[schema_model]["required"])
+
+    for prop, property_def in schema_properties.items():
+        pydantic_model_field_info = pydantic_model_fields[prop]
+        pydantic_field_required = pydantic_model_field_info.is_required()
+
+        if prop in required_schema_fields:
+            if prop in {"predicate", "type"}:
+                assert pydantic_model_field_info
             else:
-                if prop == "date":
-                    assert pydantic_model_field_info
-                else:
-                    assert not pydantic_field_required, f"{pydantic_model}.{prop}"
-
-            if "description" in property_def:
-                if prop not in {"date", "predicate"}:  # special exceptions
-                    assert property_def["description"].replace(
-                        "'", '"'
-                    ) == pydantic_model_field_info.description.replace(
-                        "'", '"'
-                    ), f"{pydantic_model}.{prop}"
+                assert pydantic_field_required, f"{pydantic_model}.{prop}"
+        else:
+            if prop == "date":
+                assert pydantic_model_field_info
             else:
-                assert (
-                    pydantic_model_field_info.description is None
+                assert not pydantic_field_required, f"{pydantic_model}.{prop}"
+
+        if "description" in property_def:
+            if prop not in {"date", "predicate"}:  # special exceptions
+                assert property_def["description"].replace(
+                    "'", '"'
+                ) == pydantic_model_field_info.description.replace(
+                    "'", '"'
                 ), f"{pydantic_model}.{prop}"
+        else:
+            assert (
+                pydantic_model_field_info.description is None
+            ), f"{pydantic_model}.{prop}"